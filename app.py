@@ -1,14 +1,20 @@
+from bisect import bisect_right
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+import altair as alt
 import pandas as pd
 from rdkit import Chem
-from rdkit.Chem import Draw
+from rdkit.Chem import AllChem
+from rdkit.Chem.Draw import rdMolDraw2D
+from drug_db import DRUG_DB, INDEX, PARAMS, A, EA_OVER_R, t90_days
 
 # --- Constants ---
-R = 8.314  # J/(mol·K)
 HARTREE_TO_KJ = 2625.5
-DAY_TO_SECONDS = 86400
+T_MIN, T_MAX = 273, 323  # K, temperature slider range
+
+# Shelf-life display units: upper bounds (days) and (days per unit, unit name)
+_T90_BOUNDS = (1.0, 30.0, 365.0)
+_T90_UNITS = ((1 / 24, "hours"), (1.0, "days"), (30.0, "months"), (365.0, "years"))
 
 # --- Custom CSS ---
 st.set_page_config(page_title="MoleQule", page_icon="⚗️", layout="wide")
@@ -30,8 +36,13 @@ table {
 .dataframe {
     font-family: 'Poppins' !important;
 }
-.sidebar-section {
-    margin-bottom: 2rem;
+/* Space between sidebar sections (the st.container blocks directly under the
+   sidebar's outermost vertical block), leaving the header and nested blocks alone.
+   Depends on Streamlit's internal DOM / data-testid names, which can change
+   between Streamlit versions. */
+section[data-testid="stSidebar"] div[data-testid="stVerticalBlock"]:not(div[data-testid="stVerticalBlock"] *)
+    > div:is([data-testid="stVerticalBlock"], :has(div[data-testid="stVerticalBlock"])):not(:last-child) {
+    margin-bottom: 1rem;
 }
 </style>
 """, unsafe_allow_html=True)
@@ -39,49 +50,6 @@ table {
 # --- Title ---
 st.markdown("<h1>⚗️ Mole<span>Q</span>ule</h1>", unsafe_allow_html=True)
 
-# --- Drug Database (Corrected Values) ---
-DRUG_DB = {
-    "Aspirin": {
-        "smiles": "CC(=O)OC1=CC=CC=C1C(=O)O",
-        "degradation": {
-            "product": "Salicylic acid",
-            "smiles": "OC1=CC=CC=C1C(=O)O",
-            "Ea": 85.2,  # kJ/mol (experimental value) :cite[2]
-            "A": 1.15e12,  # s⁻¹
-            "E0": -1027.3,
-            "E_TS": -942.1,
-            "E_deg": -950.8,
-            "t90_ref": 3.2  # years at 25°C :cite[2]
-        }
-    },
-    "Cyclobutadiene (Unstable)": {
-        "smiles": "C1=CC=C1",
-        "degradation": {
-            "product": "2 Acetylene",
-            "smiles": "C#CC#C",
-            "Ea": 25.0,  # kJ/mol (antiaromatic destabilization) :cite[1]
-            "A": 1.0e13,
-            "E0": -153.0,
-            "E_TS": -128.0,
-            "E_deg": -310.0,
-            "t90_ref": 0.003  # ~1 day at 25°C :cite[1]
-        }
-    },
-    "Methane (CH₄)": {
-        "smiles": "C",
-        "degradation": {
-            "product": "CH₃· + H·",
-            "smiles": "[CH3]",
-            "Ea": 435.0,  # kJ/mol (C-H bond strength) :cite[1]
-            "A": 1.0e16,
-            "E0": -40.5,
-            "E_TS": 394.5,
-            "E_deg": 0.0,
-            "t90_ref": 1000  # years (effectively stable) :cite[3]
-        }
-    }
-}
-
 # --- Sidebar Panel ---
 with st.sidebar:
     st.header("Input Panel")
@@ -93,25 +61,22 @@ with st.sidebar:
             list(DRUG_DB.keys()),
             key="drug_choice"
         )
-        st.markdown("<div class='sidebar-section'></div>", unsafe_allow_html=True)
     
     # Degradation Product
     drug_data = DRUG_DB[drug_choice]
     with st.container():
         st.markdown(f"**Degradation Product:**  \n{drug_data['degradation']['product']}")
-        st.markdown("<div class='sidebar-section'></div>", unsafe_allow_html=True)
     
     # Temperature Control
     with st.container():
         temperature = st.slider(
             "Temperature (K)", 
-            min_value=273, 
-            max_value=323, 
+            min_value=T_MIN, 
+            max_value=T_MAX, 
             value=298,
             step=5,
             key="temp_slider"
         )
-        st.markdown("<div class='sidebar-section'></div>", unsafe_allow_html=True)
     
     # File Upload
     with st.container():
@@ -122,84 +87,119 @@ with st.sidebar:
         )
 
 # --- Calculations ---
-def calculate_shelf_life(Ea, A, T, T_ref=298):
-    """Returns shelf life in days with reference adjustment"""
-    k_ref = A * np.exp(-Ea * 1000 / (R * T_ref))
-    k = A * np.exp(-Ea * 1000 / (R * T))
-    return (0.105 / k_ref) * (k_ref / k) * (DAY_TO_SECONDS / 86400)  # days
+# Structure helpers are uncached: structure_svgs calls each once per SMILES per process
+def mol_with_2d_coords(smiles):
+    """Returns the RDKit molecule with its 2D layout computed, or None for invalid SMILES"""
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is not None:
+        AllChem.Compute2DCoords(mol)
+    return mol
+
+def render_mol_svg(smiles, size=(300, 300)):
+    """Returns an SVG drawing of the 2D structure for a SMILES string, or None if invalid"""
+    mol = mol_with_2d_coords(smiles)
+    if mol is None:
+        return None
+    drawer = rdMolDraw2D.MolDraw2DSVG(*size)
+    drawer.DrawMolecule(mol)
+    drawer.FinishDrawing()
+    return drawer.GetDrawingText()
+
+@st.cache_resource
+def structure_svgs():
+    """Renders (reactant, product) SVGs for every drug once per server process"""
+    return {
+        name: (render_mol_svg(d["smiles"]), render_mol_svg(d["degradation"]["smiles"]))
+        for name, d in DRUG_DB.items()
+    }
+
+_STRUCTURE_SVGS = structure_svgs()
+
+_T_GRID = np.arange(T_MIN, T_MAX + 1, dtype=float)
+
+@st.cache_data
+def shelf_life_curve(drug_choice):
+    """Returns t90 in days at each temperature of _T_GRID (the slider range) for one drug"""
+    i = INDEX[drug_choice]
+    return t90_days(EA_OVER_R[i], A[i], _T_GRID)
+
+@st.cache_resource
+def energy_profile_chart(drug_choice):
+    """Returns a line chart of the reaction energy profile (cached per drug)"""
+    row = PARAMS[INDEX[drug_choice]]
+    df = pd.DataFrame({
+        "State": ["Reactant", "TS", "Product"],
+        "Energy (Hartree)": [float(row["E0"]), float(row["E_TS"]), float(row["E_deg"])]
+    })
+    return alt.Chart(df).mark_line(point=True, color='#00b4ff').encode(
+        x=alt.X("State", sort=None, title=None),
+        y=alt.Y("Energy (Hartree)", scale=alt.Scale(zero=False))
+    ).properties(height=320)
+
+def format_shelf_life(days):
+    """Formats a shelf life in days using the largest sensible unit"""
+    divisor, unit = _T90_UNITS[bisect_right(_T90_BOUNDS, days)]
+    return f"{days / divisor:.1f} {unit}"
+
+@st.cache_data
+def build_results_df(drug_choice, temperature, t90):
+    """Returns the stability-analysis table (cached per drug, temperature and t90)"""
+    deg = DRUG_DB[drug_choice]["degradation"]
+    return pd.DataFrame({
+        "Parameter": [
+            "Reactant Energy (E₀)",
+            "TS Energy (E_TS)",
+            "Product Energy (E_deg)",
+            "Activation Energy (Ea)",
+            "Frequency Factor (A)",
+            "Shelf Life (t₉₀)"
+        ],
+        "Value": [
+            f"{deg['E0']:.2f} Ha",
+            f"{deg['E_TS']:.2f} Ha",
+            f"{deg['E_deg']:.2f} Ha",
+            f"{deg['Ea']:.2f} kJ/mol",
+            f"{deg['A']:.2e} s⁻¹",
+            t90
+        ],
+        "Description": [
+            "Ground state energy",
+            "Transition state energy",
+            "Degradation product energy",
+            "Energy barrier for reaction",
+            "Collision frequency factor",
+            f"Time to 90% potency at {temperature}K"
+        ]
+    })
 
 # Get reference values
-t90_ref_days = drug_data["degradation"]["t90_ref"] * 365  # Convert years to days
 Ea = drug_data["degradation"]["Ea"]
-A = drug_data["degradation"]["A"]
 
 # Calculate temperature-adjusted shelf life
 if drug_choice == "Methane (CH₄)":
     t90 = ">1000 years"  # Too stable to measure
 else:
-    t90_days = calculate_shelf_life(Ea, A, temperature)
-    if t90_days < 1:
-        t90 = f"{t90_days*24:.1f} hours"
-    elif t90_days < 30:
-        t90 = f"{t90_days:.1f} days"
-    elif t90_days < 365:
-        t90 = f"{t90_days/30:.1f} months"
-    else:
-        t90 = f"{t90_days/365:.1f} years"
+    t90 = format_shelf_life(shelf_life_curve(drug_choice)[temperature - T_MIN])
 
 # --- Visualization ---
 st.subheader("Molecular Structures")
 col1, col2 = st.columns(2)
-try:
-    mol_react = Chem.MolFromSmiles(drug_data["smiles"])
-    col1.image(Draw.MolToImage(mol_react, size=(300,300)), caption="Reactant")
-    
-    mol_prod = Chem.MolFromSmiles(drug_data["degradation"]["smiles"])
-    col2.image(Draw.MolToImage(mol_prod, size=(300,300)), caption="Product")
-except:
+svg_react, svg_prod = _STRUCTURE_SVGS[drug_choice]
+if svg_react is not None:
+    col1.image(svg_react, caption="Reactant")
+if svg_prod is not None:
+    col2.image(svg_prod, caption="Product")
+if svg_react is None or svg_prod is None:
     st.warning("Structure rendering unavailable")
 
 # --- Energy Profile ---
 st.subheader("Reaction Energy Profile")
-fig, ax = plt.subplots(figsize=(8,4))
-energies = [
-    drug_data["degradation"]["E0"],
-    drug_data["degradation"]["E_TS"],
-    drug_data["degradation"]["E_deg"]
-]
-ax.plot(["Reactant", "TS", "Product"], energies, '-o', color='#00b4ff')
-ax.set_ylabel("Energy (Hartree)")
-st.pyplot(fig)
+st.altair_chart(energy_profile_chart(drug_choice), use_container_width=True)
 
 # --- Results Table ---
 st.subheader("Stability Analysis")
-results = pd.DataFrame({
-    "Parameter": [
-        "Reactant Energy (E₀)",
-        "TS Energy (E_TS)",
-        "Product Energy (E_deg)",
-        "Activation Energy (Ea)",
-        "Frequency Factor (A)",
-        "Shelf Life (t₉₀)"
-    ],
-    "Value": [
-        f"{drug_data['degradation']['E0']:.2f} Ha",
-        f"{drug_data['degradation']['E_TS']:.2f} Ha",
-        f"{drug_data['degradation']['E_deg']:.2f} Ha",
-        f"{Ea:.2f} kJ/mol",
-        f"{A:.2e} s⁻¹",
-        t90 if isinstance(t90, str) else f"{t90:.1f} years"
-    ],
-    "Description": [
-        "Ground state energy",
-        "Transition state energy",
-        "Degradation product energy",
-        "Energy barrier for reaction",
-        "Collision frequency factor",
-        f"Time to 90% potency at {temperature}K"
-    ]
-})
-
+# Styler is built per run: rendering mutates it, so it must not be shared across sessions
+results = build_results_df(drug_choice, temperature, t90)
 st.dataframe(results.style.set_properties(**{
     'color': 'black',
     'background-color': '#f8f9fa'
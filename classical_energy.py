@@ -1,25 +1,299 @@
-from pyscf import gto, scf, hessian
+from functools import lru_cache
+import numpy as np
 
-def calculate_ground_state_energy(molecule, basis="sto-3g"):
+# pyscf and joblib are imported inside the functions that use them, so
+# importing this module stays cheap until a calculation actually runs.
+
+@lru_cache(maxsize=8)
+def _run_hf(atom, basis):
+    """Run (and memoize) an RHF calculation for a geometry/basis pair.
+    The in-core ERI tensor (~nao^4/8 doubles) is dropped so cached entries stay small."""
+    from pyscf import gto, scf
+    mol = gto.M(atom=atom, basis=basis, symmetry=True)
+    hf = scf.RHF(mol)
+    hf.conv_tol = 1e-10  # Hessians need a tightly converged SCF
+    hf.run()
+    hf._eri = None
+    return hf
+
+def run_scf(molecule, basis="sto-3g"):
     """
-    Compute ground-state energy using Hartree-Fock (PySCF).
+    Converged RHF wavefunction for a geometry, to be shared across calculations.
     Args:
         molecule (str): e.g., "H 0 0 0; F 0 0 1.1"
         basis (str): Basis set (e.g., "sto-3g", "cc-pvdz")
+    Returns:
+        pyscf.scf.hf.RHF: Converged SCF object. The SCF itself is memoized per
+            geometry/basis; this is a copy (with its own Mole), so settings such
+            as conv_tol or a re-run do not leak into the cache. Result arrays
+            (mo_coeff, mo_energy, ...) are shared and must not be modified in place.
+    """
+    hf = _run_hf(molecule, basis).copy()
+    hf.mol = hf.mol.copy()
+    return hf
+
+def _as_scf(molecule, basis):
+    """Accept either a geometry string or an already converged SCF object."""
+    return run_scf(molecule, basis) if isinstance(molecule, str) else molecule
+
+def _c1_copy(mol):
+    """
+    Copy of mol without point-group symmetry, since displacements break it.
+    Coordinates are stored in Bohr so displaced geometries (also in Bohr) can
+    be swapped in without pyscf changing, and warning about, the unit.
+    """
+    coords = mol.atom_coords()
+    mol = mol.copy()
+    mol.atom = [(mol.atom_symbol(i), coords[i]) for i in range(mol.natm)]
+    mol.unit = "Bohr"
+    mol.symmetry = False
+    mol.build(False, False)
+    return mol
+
+def _hessian_times(hf, c1mol, direction, step):
+    """
+    Hessian-vector product H d by central differences of analytic gradients
+    along a unit displacement d of shape (natm, 3); costs two SCF + gradient runs.
+    """
+    from pyscf import scf
+    coords = hf.mol.atom_coords()
+    grads = []
+    for sign in (1, -1):
+        dmol = c1mol.set_geom_(coords + sign * step * direction, unit="Bohr",
+                               symmetry=False, inplace=False)
+        dhf = scf.RHF(dmol)
+        dhf.conv_tol = hf.conv_tol
+        dhf.verbose = 0
+        dhf.kernel(dm0=hf.make_rdm1())
+        grads.append(dhf.nuc_grad_method().kernel())
+    return ((grads[0] - grads[1]) / (2 * step)).ravel()
+
+def _fd_gradient_hessian(hf, step=1e-3):
+    """
+    Hessian by central differences of analytic RHF gradients.
+    Args:
+        hf: Converged RHF object at the reference geometry
+        step (float): Displacement in Bohr
+    Returns:
+        ndarray: Hessian of shape (natm, natm, 3, 3), as pyscf's analytic Hessian
+    """
+    natm = hf.mol.natm
+    # Build the C1 copy once so each displacement only swaps coordinates in
+    c1mol = _c1_copy(hf.mol)
+    h = np.zeros((natm, natm, 3, 3))
+    for i in range(natm):
+        for a in range(3):
+            direction = np.zeros((natm, 3))
+            direction[i, a] = 1.0
+            h[i, :, a, :] = _hessian_times(hf, c1mol, direction, step).reshape(natm, 3)
+    # Symmetrize to remove finite-difference noise
+    return 0.5 * (h + h.transpose(1, 0, 3, 2))
+
+def _displaced_energy(symbols, coords, basis, conv_tol):
+    """RHF energy at a displaced geometry (coords in Bohr); runs in a joblib worker."""
+    from pyscf import gto, scf
+    mol = gto.M(atom=list(zip(symbols, coords)), basis=basis, unit="Bohr")
+    hf = scf.RHF(mol)
+    hf.conv_tol = conv_tol
+    hf.verbose = 0
+    return hf.kernel()
+
+def _interatomic_pairs(natm):
+    """All (i, a, j, b) Cartesian pairs with i < j (atom indices) and a, b in x/y/z."""
+    return [(i, a, j, b)
+            for i in range(natm) for j in range(i + 1, natm)
+            for a in range(3) for b in range(3)]
+
+def _fd_pair_values(mol, pairs, step, nproc, conv_tol=1e-10):
+    """
+    Second derivatives d2E/dx_ia dx_jb by four-point central differences:
+    (E(++) - E(+-) - E(-+) + E(--)) / (4 h^2). The 4 * len(pairs) displaced
+    SCFs are independent and run in parallel.
+    """
+    from joblib import Parallel, delayed
+    symbols = [mol.atom_symbol(k) for k in range(mol.natm)]
+    coords = mol.atom_coords()
+    geoms = []
+    for i, a, j, b in pairs:
+        for si, sj in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+            disp = coords.copy()
+            disp[i, a] += si * step
+            disp[j, b] += sj * step
+            geoms.append(disp)
+    energies = Parallel(n_jobs=nproc)(
+        delayed(_displaced_energy)(symbols, g, mol.basis, conv_tol) for g in geoms
+    )
+    e = np.asarray(energies).reshape(len(pairs), 4)
+    return (e[:, 0] - e[:, 1] - e[:, 2] + e[:, 3]) / (4 * step ** 2)
+
+def _assemble_hessian(natm, pairs, values):
+    """
+    Build a (natm, natm, 3, 3) Hessian from interatomic blocks, filling the
+    on-site blocks from translational invariance: H_ii = -sum_{k != i} H_ik.
+    """
+    h = np.zeros((natm, natm, 3, 3))
+    for (i, a, j, b), v in zip(pairs, values):
+        h[i, j, a, b] = v
+        h[j, i, b, a] = v
+    for i in range(natm):
+        onsite = -h[i].sum(axis=0)
+        h[i, i] = 0.5 * (onsite + onsite.T)
+    return h
+
+def _l1_recover_hessian(D, G, W, lam, max_iter=20000, tol=1e-10):
+    """
+    Sparse symmetric Hessian from products G = H D, by FISTA on
+    0.5 * ||H D - G||^2 + lam * sum(W * |H|).
+    Args:
+        D (ndarray): Displacement directions, shape (3N, m)
+        G (ndarray): Measured Hessian-vector products, shape (3N, m)
+        W (ndarray): Per-entry L1 weights, shape (3N, 3N)
+        lam (float): Penalty, relative to the smallest lam that zeroes H
+    Returns:
+        ndarray: Hessian of shape (3N, 3N)
+    """
+    def sym(x):
+        return 0.5 * (x + x.T)
+    step = 1.0 / np.linalg.norm(D, 2) ** 2
+    thresh = lam * np.max(np.abs(sym(G @ D.T)) / W) * W * step
+    h = y = np.zeros((D.shape[0], D.shape[0]))
+    t = 1.0
+    for _ in range(max_iter):
+        z = y - step * sym((y @ D - G) @ D.T)
+        h_new = np.sign(z) * np.maximum(np.abs(z) - thresh, 0.0)
+        t_new = 0.5 * (1 + np.sqrt(1 + 4 * t * t))
+        y = h_new + (t - 1) / t_new * (h_new - h)
+        converged = np.linalg.norm(h_new - h) <= tol * max(np.linalg.norm(h_new), 1.0)
+        h, t = h_new, t_new
+        if converged:
+            break
+    return h
+
+def calculate_ground_state_energy(molecule, basis="sto-3g"):
+    """
+    Compute ground-state energy using Hartree-Fock (PySCF).
+    Args:
+        molecule (str or RHF): e.g., "H 0 0 0; F 0 0 1.1", or the result of run_scf
+        basis (str): Basis set (e.g., "sto-3g", "cc-pvdz"); ignored for an RHF object
     Returns:
         float: Ground-state energy (in Hartree)
     """
-    mol = gto.M(atom=molecule, basis=basis)
-    hf = scf.RHF(mol).run()
-    return hf.e_tot
+    return _as_scf(molecule, basis).e_tot
 
-def compute_vibrational_frequencies(molecule):
+def compute_vibrational_frequencies(molecule, dertype="analytic"):
     """
     Check stability via vibrational frequencies.
+    Args:
+        molecule (str or RHF): e.g., "H 0 0 0; F 0 0 1.1", or the result of run_scf
+        dertype (str): "analytic" for the analytic RHF Hessian, or "gradient"
+            for central differences of analytic gradients (fallback when the
+            analytic Hessian stalls)
+    Returns:
+        list: Frequencies (cm⁻¹). If any are negative, molecule is unstable.
+    """
+    from pyscf import hessian
+    from pyscf.hessian import thermo
+    hf = _as_scf(molecule, "sto-3g")
+    if dertype == "analytic":
+        hess = hessian.RHF(hf).kernel()
+    elif dertype == "gradient":
+        hess = _fd_gradient_hessian(hf)
+    else:
+        raise ValueError(f"Unknown dertype: {dertype}")
+    freqs = thermo.harmonic_analysis(hf.mol, hess, imaginary_freq=False)
+    return freqs["freq_wavenumber"]
+
+def compute_vibrational_frequencies_fd(molecule, basis="sto-3g", step=1e-2, nproc=-1):
+    """
+    Vibrational frequencies from an energy-only finite-difference Hessian.
+    Every displaced-geometry SCF is independent, so they are farmed out to
+    joblib workers; use this when the analytic Hessian is unavailable.
+    Args:
+        molecule (str): e.g., "H 0 0 0; F 0 0 1.1"
+        basis (str): Basis set
+        step (float): Displacement in Bohr
+        nproc (int): joblib n_jobs (-1 uses all cores)
+    Returns:
+        list: Frequencies (cm⁻¹). If any are negative, molecule is unstable.
+    """
+    from pyscf import gto
+    from pyscf.hessian import thermo
+    mol = gto.M(atom=molecule, basis=basis)
+    pairs = _interatomic_pairs(mol.natm)
+    values = _fd_pair_values(mol, pairs, step, nproc)
+    hess = _assemble_hessian(mol.natm, pairs, values)
+    freqs = thermo.harmonic_analysis(mol, hess, imaginary_freq=False)
+    return freqs["freq_wavenumber"]
+
+def compute_vibrational_frequencies_cs(molecule, basis="sto-3g", step=1e-3, fraction=0.25,
+                                       lam=1e-6, tol=0.005, n_check=3, seed=None):
+    """
+    Vibrational frequencies from a compressed-sensing Hessian.
+    Instead of one gradient-difference column per Cartesian coordinate (the
+    dertype="gradient" path, 3N columns), H d is measured along fewer random
+    directions d and H is recovered by weighted L1 minimization, exploiting
+    that couplings between distant atoms are small. Translational invariance
+    (H t = 0) is added as free measurements. Held-out random directions
+    check the recovery; while their relative error exceeds tol the number of
+    directions is doubled, up to 3N, where the solve becomes exact.
+    Args:
+        molecule (str): e.g., "H 0 0 0; F 0 0 1.1"
+        basis (str): Basis set
+        step (float): Displacement in Bohr
+        fraction (float): Initial number of directions as a fraction of 3N
+        lam (float): Relative L1 penalty
+        tol (float): Allowed relative error on the held-out directions
+        n_check (int): Number of held-out directions
+        seed (int): Seed for the random directions
     Returns:
         list: Frequencies (cm⁻¹). If any are negative, molecule is unstable.
     """
-    mol = gto.M(atom=molecule, basis="sto-3g")
-    hf = scf.RHF(mol).run()
-    hess = hessian.RHF(hf).run()
-    return hess.vib_freq()
\ No newline at end of file
+    from pyscf.hessian import thermo
+    hf = _run_hf(molecule, basis)
+    mol = hf.mol
+    natm, n = mol.natm, 3 * mol.natm
+    c1mol = _c1_copy(mol)
+    rng = np.random.default_rng(seed)
+
+    def random_directions(count):
+        d = rng.standard_normal((n, count))
+        return d / np.linalg.norm(d, axis=0)
+
+    def measure(d):
+        return np.column_stack([_hessian_times(hf, c1mol, col.reshape(natm, 3), step)
+                                for col in d.T])
+
+    # Rigid translations are exact zero modes
+    trans = np.zeros((n, 3))
+    for b in range(3):
+        trans[b::3, b] = 1.0 / np.sqrt(natm)
+    # Penalize couplings between distant atoms more (distances in Bohr)
+    coords = mol.atom_coords()
+    dist = np.linalg.norm(coords[:, None] - coords[None, :], axis=-1)
+    W = np.repeat(np.repeat(1.0 + dist / dist.mean(), 3, axis=0), 3, axis=1)
+
+    # Never spend more than the 3N directions of the plain gradient path
+    n_check = min(n_check, n - 1)
+    max_dirs = n - n_check
+    V = random_directions(n_check)
+    HV = measure(V)
+    D = random_directions(min(max_dirs, max(1, int(np.ceil(fraction * n)))))
+    G = measure(D)
+    while True:
+        if D.shape[1] >= max_dirs:
+            # Fully determined: use every measurement, held-out ones included
+            D_all = np.hstack([D, V, trans])
+            G_all = np.hstack([G, HV, np.zeros((n, 3))])
+            hmat = np.linalg.lstsq(D_all.T, G_all.T, rcond=None)[0].T
+            hmat = 0.5 * (hmat + hmat.T)
+            break
+        hmat = _l1_recover_hessian(np.hstack([D, trans]),
+                                   np.hstack([G, np.zeros((n, 3))]), W, lam)
+        if np.linalg.norm(hmat @ V - HV) <= tol * np.linalg.norm(HV):
+            break
+        extra = random_directions(min(max_dirs, 2 * D.shape[1]) - D.shape[1])
+        D = np.hstack([D, extra])
+        G = np.hstack([G, measure(extra)])
+    hess = hmat.reshape(natm, 3, natm, 3).transpose(0, 2, 1, 3)
+    freqs = thermo.harmonic_analysis(mol, hess, imaginary_freq=False)
+    return freqs["freq_wavenumber"]
\ No newline at end of file
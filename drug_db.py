@@ -0,0 +1,70 @@
+import numpy as np
+
+R = 8.314  # J/(mol·K)
+
+# --- Drug Database (Corrected Values) ---
+DRUG_DB = {
+    "Aspirin": {
+        "smiles": "CC(=O)OC1=CC=CC=C1C(=O)O",
+        "degradation": {
+            "product": "Salicylic acid",
+            "smiles": "OC1=CC=CC=C1C(=O)O",
+            "Ea": 85.2,  # kJ/mol (experimental value) :cite[2]
+            "A": 1.15e12,  # s⁻¹
+            "E0": -1027.3,
+            "E_TS": -942.1,
+            "E_deg": -950.8,
+            "t90_ref": 3.2  # years at 25°C :cite[2]
+        }
+    },
+    "Cyclobutadiene (Unstable)": {
+        "smiles": "C1=CC=C1",
+        "degradation": {
+            "product": "2 Acetylene",
+            "smiles": "C#CC#C",
+            "Ea": 25.0,  # kJ/mol (antiaromatic destabilization) :cite[1]
+            "A": 1.0e13,
+            "E0": -153.0,
+            "E_TS": -128.0,
+            "E_deg": -310.0,
+            "t90_ref": 0.003  # ~1 day at 25°C :cite[1]
+        }
+    },
+    "Methane (CH₄)": {
+        "smiles": "C",
+        "degradation": {
+            "product": "CH₃· + H·",
+            "smiles": "[CH3]",
+            "Ea": 435.0,  # kJ/mol (C-H bond strength) :cite[1]
+            "A": 1.0e16,
+            "E0": -40.5,
+            "E_TS": 394.5,
+            "E_deg": 0.0,
+            "t90_ref": 1000  # years (effectively stable) :cite[3]
+        }
+    }
+}
+
+# --- Degradation parameters packed into one contiguous table (one row per drug) ---
+NAMES = list(DRUG_DB)
+INDEX = {name: i for i, name in enumerate(NAMES)}
+
+PARAMS_DTYPE = np.dtype([
+    ("Ea", "f4"),       # kJ/mol
+    ("A", "f4"),        # s⁻¹
+    ("E0", "f4"),       # Hartree
+    ("E_TS", "f4"),
+    ("E_deg", "f4"),
+])
+PARAMS = np.array(
+    [tuple(DRUG_DB[n]["degradation"][k] for k in PARAMS_DTYPE.names) for n in NAMES],
+    dtype=PARAMS_DTYPE
+)
+
+# Arrhenius inputs are widened to float64: exp(-Ea/RT) underflows float32 for methane
+A = PARAMS["A"].astype(np.float64)
+EA_OVER_R = PARAMS["Ea"].astype(np.float64) * 1000.0 / R  # K
+
+def t90_days(Ea_over_R, A, T):
+    """Shelf life (t90 = 0.105 / k, k = A exp(-Ea / RT)); broadcasts over arrays"""
+    return 0.105 / (A * np.exp(-Ea_over_R / T))  # days
\ No newline at end of file
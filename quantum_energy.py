@@ -1,10 +1,21 @@
-from qiskit_nature.second_q.drivers import PySCFDriver
-from qiskit_nature.second_q.mappers import JordanWignerMapper
-from qiskit_nature.second_q.algorithms import GroundStateEigensolver
-from qiskit_algorithms import VQE
-from qiskit_aer.primitives import Estimator
-from qiskit.circuit.library import EfficientSU2
+from functools import lru_cache
 
+# qiskit imports are deferred to first use, so importing this module stays
+# cheap until a calculation actually runs.
+
+@lru_cache(maxsize=None)
+def _mapper():
+    """Geometry-independent qubit mapper, shared by every calculation."""
+    from qiskit_nature.second_q.mappers import JordanWignerMapper
+    return JordanWignerMapper()
+
+@lru_cache(maxsize=None)
+def _estimator():
+    """Geometry-independent Estimator, shared by every calculation."""
+    from qiskit_aer.primitives import Estimator
+    return Estimator()
+
+@lru_cache(maxsize=32)
 def calculate_quantum_energy(molecule, basis="sto-3g"):
     """
     Compute ground-state energy using VQE (Qiskit).
@@ -13,11 +24,15 @@ def calculate_quantum_energy(molecule, basis="sto-3g"):
     Returns:
         float: Ground-state energy (in Hartree)
     """
+    from qiskit_nature.second_q.drivers import PySCFDriver
+    from qiskit_nature.second_q.algorithms import GroundStateEigensolver
+    from qiskit_algorithms import VQE
+    from qiskit.circuit.library import EfficientSU2
     driver = PySCFDriver(atom=molecule, basis=basis)
     problem = driver.run()
-    mapper = JordanWignerMapper()
+    # Built per call: VQE resizes the ansatz in place, so it must not be shared
     ansatz = EfficientSU2(problem.num_spatial_orbitals)
-    vqe = VQE(Estimator(), ansatz)
-    solver = GroundStateEigensolver(mapper, vqe)
+    vqe = VQE(_estimator(), ansatz)
+    solver = GroundStateEigensolver(_mapper(), vqe)
     result = solver.solve(problem)
     return result.total_energies[0]
\ No newline at end of file
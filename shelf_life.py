@@ -0,0 +1,29 @@
+import numpy as np
+from drug_db import A, EA_OVER_R, t90_days
+
+# Batch shelf-life screens (drugs x temperatures). numba is optional and
+# resolved once here; without it the grid is one NumPy broadcast.
+try:
+    from numba import njit, prange
+except ImportError:
+    _shelf_life_grid = None
+else:
+    _t90_days_jit = njit(cache=True)(t90_days)
+
+    # Module-level so numba can cache the compiled kernel on disk (cache=True)
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _shelf_life_grid(Ea_over_R, A, T, out):
+        for i in prange(Ea_over_R.size):
+            for j in range(T.size):
+                out[i, j] = _t90_days_jit(Ea_over_R[i], A[i], T[j])
+
+def calculate_shelf_life_batch(T, idx=None):
+    """Returns shelf life in days for drugs x temperatures (all drugs if idx is None)"""
+    Ea_over_R = np.atleast_1d(EA_OVER_R if idx is None else EA_OVER_R[idx])
+    A_sel = np.atleast_1d(A if idx is None else A[idx])
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    if _shelf_life_grid is None:
+        return t90_days(Ea_over_R[:, None], A_sel[:, None], T[None, :])
+    out = np.empty((Ea_over_R.size, T.size))
+    _shelf_life_grid(Ea_over_R, A_sel, T, out)
+    return out
\ No newline at end of file
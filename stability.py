@@ -1,12 +1,35 @@
+import numpy as np
+from classical_energy import run_scf, calculate_ground_state_energy, compute_vibrational_frequencies
+
 def predict_stability(ground_energy, vibrational_freqs):
     """
     Predicts if a molecule is stable.
     Args:
         ground_energy (float): Energy in Hartree
-        vibrational_freqs (list): Frequencies in cm⁻¹
+        vibrational_freqs (list): Frequencies in cm⁻¹; imaginary modes may be
+            given as negative reals or as complex values
     Returns:
         str: "Stable" or "Unstable"
     """
-    if any(freq < 0 for freq in vibrational_freqs):
+    freqs = np.asarray(vibrational_freqs)
+    if np.iscomplexobj(freqs):
+        unstable = (freqs.imag != 0).any() or (freqs.real < 0).any()
+    else:
+        unstable = (freqs < 0).any()
+    if unstable:
         return "Unstable (imaginary frequencies)"
-    return "Thermodynamically Stable"
\ No newline at end of file
+    return "Thermodynamically Stable"
+
+def analyze_stability(molecule, basis="sto-3g"):
+    """
+    Runs the ground-state -> frequencies -> stability pipeline on one SCF.
+    Args:
+        molecule (str): e.g., "H 0 0 0; F 0 0 1.1"
+        basis (str): Basis set
+    Returns:
+        tuple: (ground-state energy in Hartree, frequencies in cm⁻¹, stability label)
+    """
+    hf = run_scf(molecule, basis)
+    energy = calculate_ground_state_energy(hf)
+    freqs = compute_vibrational_frequencies(hf)
+    return energy, freqs, predict_stability(energy, freqs)
\ No newline at end of file